@@ -1,16 +1,91 @@
+import io
 import os
+import re
+import ast
+import sys
 import json
-import subprocess
-from typing import Dict, Any, List
+import contextlib
+import functools
+import importlib.util
+import multiprocessing
+from typing import Dict, Any, List, Optional, Tuple
 
+import pytest  # pip install pytest (pytest-xdist recommended for parallel runs)
 import yaml  # pip install pyyaml
+try:
+    from yaml import CSafeLoader as _SafeLoader  # libyaml-backed parser
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+try:
+    from orjson import loads as _json_loads  # optional: pip install orjson
+except ImportError:
+    _json_loads = json.loads
 from anthropic import Anthropic  # pip install anthropic
 
 
-def load_config(path: str = "agents.yaml") -> Dict[str, Any]:
-    """Load YAML configuration for agents."""
+# Patterns used by extract_json_from_text, compiled once at import time
+_JSON_BLOCK_RE = re.compile(r"```json(.*?)```", re.DOTALL | re.IGNORECASE)
+_FILE_PAIR_RE = re.compile(
+    r'{"path"\s*:\s*"([^"]+)"\s*,\s*"content"\s*:\s*"((?:[^"\\]|\\.)*)"\s*}',
+    re.DOTALL,
+)
+
+# read_current_files cache: path -> (mtime_ns, size, text)
+_FILE_CACHE: Dict[str, Tuple[int, int, str]] = {}
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML config; (mtime_ns, size) are only part of the cache key."""
     with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_SafeLoader)
+
+
+def load_config(path: str = "agents.yaml") -> Dict[str, Any]:
+    """Load YAML configuration for agents.
+
+    Parsed configs are cached per (absolute path, mtime, size), so edits to the
+    file are picked up while repeated loads skip the YAML parse. The returned
+    dict is shared between callers and should be treated as read-only.
+    """
+    abs_path = os.path.abspath(path)
+    st = os.stat(abs_path)
+    return _load_config_cached(abs_path, st.st_mtime_ns, st.st_size)
+
+
+def _find_json_span(s: str) -> Optional[Tuple[int, int]]:
+    """
+    Locate the first complete top-level {...} object in `s` with a single scan.
+
+    Braces inside double-quoted strings (including escaped quotes) are ignored.
+    Returns (start, end_inclusive), or None if no balanced object is found.
+    """
+    start = -1
+    depth = 0
+    in_string = False
+    escaped = False
+
+    for i, ch in enumerate(s):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            if depth > 0:
+                in_string = True
+        elif ch == "{":
+            if depth == 0:
+                start = i
+            depth += 1
+        elif ch == "}" and depth > 0:
+            depth -= 1
+            if depth == 0:
+                return start, i
+
+    return None
 
 
 def extract_json_from_text(text: str) -> Any:
@@ -19,32 +94,41 @@ def extract_json_from_text(text: str) -> Any:
 
     Prefer content inside ```json ... ``` blocks.
     Strategy:
-      1) Try strict json.loads on the object.
+      1) Try strict JSON parsing (orjson if installed, then json.loads).
       2) If that fails, try ast.literal_eval after normalising triple quotes.
       3) If that still fails, as a last resort extract just the "files" array
          (path/content pairs) and return {"plan": "", "files": [...]}.
     """
-    import re
-    import ast
-
     # Prefer a fenced ```json ... ``` block if present
-    code_block_match = re.search(r"```json(.*?)```", text, re.DOTALL | re.IGNORECASE)
+    code_block_match = _JSON_BLOCK_RE.search(text)
     candidate = code_block_match.group(1) if code_block_match else text
 
     candidate = candidate.strip()
 
-    # Isolate something that looks like a top-level object
-    start = candidate.find("{")
-    end = candidate.rfind("}")
+    # Isolate the first balanced top-level object; if braces never balance,
+    # fall back to the outermost braces so the lenient parsers below can try
+    span = _find_json_span(candidate)
+    if span is not None:
+        start, end = span
+    else:
+        start = candidate.find("{")
+        end = candidate.rfind("}")
     if start == -1 or end == -1 or end <= start:
         raise ValueError("No JSON object found in model response.")
     obj_str = candidate[start : end + 1]
 
-    # 1) Strict JSON
+    # 1) Strict JSON (orjson's C parser when available). orjson rejects some
+    #    input the stdlib accepts, such as lone surrogate escapes, so retry
+    #    with json.loads before falling back to the lenient parsers
     try:
-        return json.loads(obj_str)
+        return _json_loads(obj_str)
     except Exception:
         pass
+    if _json_loads is not json.loads:
+        try:
+            return json.loads(obj_str)
+        except Exception:
+            pass
 
     # 2) Python literal after normalising triple-quotes
     try:
@@ -55,11 +139,7 @@ def extract_json_from_text(text: str) -> Any:
 
     # 3) Last resort: extract files only (path/content pairs)
     files: List[Dict[str, str]] = []
-    file_pattern = re.compile(
-        r'{"path"\s*:\s*"([^"]+)"\s*,\s*"content"\s*:\s*"((?:[^"\\]|\\.)*)"\s*}',
-        re.DOTALL,
-    )
-    for m in file_pattern.finditer(candidate):
+    for m in _FILE_PAIR_RE.finditer(candidate):
         path = m.group(1)
         content = m.group(2)
         files.append({"path": path, "content": content})
@@ -78,26 +158,29 @@ def call_agent(
     messages: List[Dict[str, str]],
 ) -> str:
     """
-    Call an Anthropic model using the Messages API and return plain text.
+    Call an Anthropic model using the streaming Messages API and return plain text.
     `messages` should be a list of {"role": "...", "content": "..."} dicts.
     """
-    response = client.messages.create(
+    # Stream the response so text is consumed as it is generated
+    parts: List[str] = []
+    with client.messages.stream(
         model=model,
         max_tokens=16384,
         temperature=0.2,
         system=system_prompt,
         messages=messages,
-    )
-    # Assemble all text blocks into one string
-    parts: List[str] = []
-    for block in response.content:
-        if block.type == "text":
-            parts.append(block.text)
-    return "\n".join(parts).strip()
+    ) as stream:
+        for text in stream.text_stream:
+            parts.append(text)
+    return "".join(parts).strip()
 
 
 def read_current_files() -> str:
-    """Read all relevant source files and return their contents as a formatted string."""
+    """Read all relevant source files and return their contents as a formatted string.
+
+    File contents are cached by (mtime, size) so unchanged files are not re-read
+    on every orchestrator iteration.
+    """
     file_paths = [
         "rta/__init__.py",
         "rta/models.py",
@@ -110,8 +193,15 @@ def read_current_files() -> str:
     for path in file_paths:
         if os.path.exists(path):
             try:
-                with open(path, "r", encoding="utf-8") as f:
-                    content = f.read()
+                # Reuse the cached text unless mtime or size changed
+                st = os.stat(path)
+                cached = _FILE_CACHE.get(path)
+                if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                    content = cached[2]
+                else:
+                    with open(path, "r", encoding="utf-8") as f:
+                        content = f.read()
+                    _FILE_CACHE[path] = (st.st_mtime_ns, st.st_size, content)
                 sections.append(f"=== {path} ===\n{content}")
             except Exception as e:
                 sections.append(f"=== {path} ===\n[Error reading file: {e}]")
@@ -121,39 +211,84 @@ def read_current_files() -> str:
 
 
 def apply_file_updates(files: List[Dict[str, str]]) -> None:
-    """Write each file's content to disk (overwriting existing files)."""
+    """Write each file's content to disk (overwriting existing files).
+
+    Files whose on-disk bytes already match are left untouched, which keeps
+    their mtime stable for the read_current_files cache.
+    """
     for f in files:
         path = f["path"]
         content = f["content"]
+        if os.path.isfile(path):
+            with open(path, "rb") as fp:
+                if fp.read() == content.encode("utf-8"):
+                    print(f"[orchestrator] Unchanged file: {path}")
+                    continue
         directory = os.path.dirname(path)
-        if directory:
+        if directory and not os.path.isdir(directory):
             os.makedirs(directory, exist_ok=True)
         with open(path, "w", encoding="utf-8") as fp:
             fp.write(content)
         print(f"[orchestrator] Updated file: {path}")
 
 
+def _pytest_worker(args: List[str], cwd: str, conn: Any) -> None:
+    """Run pytest.main in a child process and send back (returncode, output)."""
+    # Ensure the project root is importable, as PYTHONPATH did for the CLI
+    os.environ["PYTHONPATH"] = cwd + os.pathsep + os.environ.get("PYTHONPATH", "")
+    if cwd not in sys.path:
+        sys.path.insert(0, cwd)
+
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+        returncode = int(pytest.main(args))
+    conn.send((returncode, buf.getvalue()))
+    conn.close()
+
+
 def run_pytest() -> Dict[str, Any]:
     """Run pytest -q and capture result.
 
-    Ensures the project root is on PYTHONPATH so 'rta' can be imported.
+    pytest runs via pytest.main in a child process rather than a fresh `pytest`
+    subprocess; on Linux the child is forked, so the interpreter and pytest
+    itself are already loaded. The child is still needed for isolation: the
+    coder rewrites rta/ between iterations and an in-process run would keep
+    testing the stale modules.
+
+    If pytest-xdist is installed, tests are distributed across all cores.
     """
     print("[orchestrator] Running pytest...")
-    env = os.environ.copy()
-    cwd = os.getcwd()
-    env["PYTHONPATH"] = cwd + os.pathsep + env.get("PYTHONPATH", "")
-
-    proc = subprocess.run(
-        ["pytest", "-q"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-        env=env,
-    )
+    args = ["-q", "-p", "no:cacheprovider"]
+    # Spread test files across all cores when pytest-xdist is installed
+    if importlib.util.find_spec("xdist") is not None:
+        args += ["-n", "auto", "--dist", "loadfile"]
+    args.append("tests")
+
+    # fork reuses the already-initialised interpreter. Only use it on Linux:
+    # on macOS forking a process that has loaded system frameworks or started
+    # threads is unsafe, so keep the platform default everywhere else
+    if sys.platform.startswith("linux"):
+        ctx = multiprocessing.get_context("fork")
+    else:
+        ctx = multiprocessing.get_context()
+
+    recv_conn, send_conn = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_pytest_worker, args=(args, os.getcwd(), send_conn))
+    proc.start()
+    send_conn.close()
+
+    try:
+        returncode, output = recv_conn.recv()
+    except EOFError:
+        returncode, output = 1, "[orchestrator] pytest worker exited without reporting a result."
+    finally:
+        recv_conn.close()
+    proc.join()
+
     return {
-        "returncode": proc.returncode,
-        "output": proc.stdout,
-        "status": "pass" if proc.returncode == 0 else "fail",
+        "returncode": returncode,
+        "output": output,
+        "status": "pass" if returncode == 0 else "fail",
     }
 
 
@@ -2,21 +2,57 @@
 
 Generates random task sets at various utilisation levels using UUniFast,
 runs RTA on each, and plots the schedulability ratio as a function of utilisation.
+
+The plot is written as a dependency-free SVG by default; pass --backend=mpl to
+render a PNG with matplotlib instead.
 """
 
+import argparse
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-
-try:
-    import matplotlib
-    matplotlib.use('Agg')  # Non-interactive backend
-    import matplotlib.pyplot as plt
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
+from typing import Optional, Sequence, Tuple
 
 from rta.generators import generate_taskset
-from rta.analysis import analyze_taskset
+from rta.analysis import analyze_taskset, satisfies_hyperbolic_bound
+
+
+def _trial(args: tuple) -> Tuple[float, bool]:
+    """Generate and analyse a single random task set.
+    
+    Top-level so it can be pickled and dispatched to worker processes.
+    
+    Args:
+        args: Tuple of (u_total, i, num_tasks, min_period, max_period, seed).
+    
+    Returns:
+        Tuple of (u_total, schedulable).
+    """
+    u_total, i, num_tasks, min_period, max_period, seed = args
+    
+    # Use different seed for each task set
+    task_set_seed = seed + int(u_total * 1000) + i
+    
+    # Generate random task set
+    taskset = generate_taskset(
+        n=num_tasks,
+        target_utilization=u_total,
+        period_min=min_period,
+        period_max=max_period,
+        seed=task_set_seed,
+    )
+    
+    # Accept cheaply via the hyperbolic bound, otherwise run exact RTA
+    if satisfies_hyperbolic_bound(taskset):
+        return u_total, True
+    
+    schedulable, _ = analyze_taskset(taskset, short_circuit=True)
+    return u_total, schedulable
+
+
+# Below this many trials the whole experiment runs in well under the time it
+# takes to start a worker pool, so it is run in-process
+_MIN_PARALLEL_TRIALS = 2000
 
 
 def run_schedulability_experiment(
@@ -26,9 +62,14 @@ def run_schedulability_experiment(
     min_period: float = 10.0,
     max_period: float = 1000.0,
     seed: int = 42,
+    max_workers: Optional[int] = None,
 ) -> dict:
     """Run schedulability experiment across utilisation levels.
     
+    Trials are independent, so they are fanned out across worker processes.
+    With a single worker or only a few trials they run in-process instead,
+    which avoids the cost of starting the pool.
+    
     Args:
         utilisation_points: List of utilisation values to test (e.g. [0.1, 0.2, ..., 0.9]).
         num_task_sets_per_point: Number of random task sets to generate per utilisation.
@@ -36,54 +77,111 @@ def run_schedulability_experiment(
         min_period: Minimum task period.
         max_period: Maximum task period.
         seed: Base random seed (will be varied per task set).
+        max_workers: Number of worker processes (defaults to os.cpu_count());
+                     1 runs every trial in-process.
     
     Returns:
         Dictionary mapping utilisation -> schedulability ratio.
     """
-    results = {}
+    all_args = [
+        (u_total, i, num_tasks, min_period, max_period, seed)
+        for u_total in utilisation_points
+        for i in range(num_task_sets_per_point)
+    ]
     
-    for u_total in utilisation_points:
-        schedulable_count = 0
-        
-        for i in range(num_task_sets_per_point):
-            # Use different seed for each task set
-            task_set_seed = seed + int(u_total * 1000) + i
-            
-            # Generate random task set
-            taskset = generate_taskset(
-                n=num_tasks,
-                target_utilization=u_total,
-                period_min=min_period,
-                period_max=max_period,
-                seed=task_set_seed,
-            )
-            
-            # Run RTA
-            schedulable, _ = analyze_taskset(taskset)
-            
-            # Check if schedulable
+    schedulable_counts = {u_total: 0 for u_total in utilisation_points}
+    
+    if max_workers is None:
+        max_workers = os.cpu_count()
+    
+    if max_workers == 1 or len(all_args) < _MIN_PARALLEL_TRIALS:
+        for u_total, schedulable in map(_trial, all_args):
             if schedulable:
-                schedulable_count += 1
-        
-        # Compute schedulability ratio
-        schedulability_ratio = schedulable_count / num_task_sets_per_point
-        results[u_total] = schedulability_ratio
+                schedulable_counts[u_total] += 1
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for u_total, schedulable in executor.map(_trial, all_args, chunksize=32):
+                if schedulable:
+                    schedulable_counts[u_total] += 1
+    
+    # Compute schedulability ratio
+    results = {}
+    for u_total in utilisation_points:
+        results[u_total] = schedulable_counts[u_total] / num_task_sets_per_point
     
     return results
 
 
+def _write_svg(xs: Sequence[float], ys: Sequence[float], output_path: str) -> None:
+    """Write a minimal SVG line chart of ys against xs on [0, 1] x [0, 1.05]."""
+    width, height = 640, 400
+    left, right, top, bottom = 70, 20, 40, 60
+    plot_w = width - left - right
+    plot_h = height - top - bottom
+    
+    def px(x: float) -> float:
+        return left + x * plot_w
+    
+    def py(y: float) -> float:
+        return top + (1.0 - y / 1.05) * plot_h
+    
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'font-family="sans-serif" font-size="12">',
+        f'<rect width="{width}" height="{height}" fill="white"/>',
+    ]
+    
+    # Grid lines and tick labels at 0.0, 0.2, ..., 1.0 on both axes
+    for k in range(6):
+        v = k / 5
+        parts.append(f'<line x1="{px(v):.1f}" y1="{py(0):.1f}" x2="{px(v):.1f}" '
+                     f'y2="{py(1.05):.1f}" stroke="#ddd"/>')
+        parts.append(f'<text x="{px(v):.1f}" y="{py(0) + 18:.1f}" text-anchor="middle">{v:.1f}</text>')
+        parts.append(f'<line x1="{px(0):.1f}" y1="{py(v):.1f}" x2="{px(1):.1f}" '
+                     f'y2="{py(v):.1f}" stroke="#ddd"/>')
+        parts.append(f'<text x="{px(0) - 8:.1f}" y="{py(v) + 4:.1f}" text-anchor="end">{v:.1f}</text>')
+    
+    # Axes, data and labels
+    parts.append(f'<polyline points="{px(0):.1f},{py(1.05):.1f} {px(0):.1f},{py(0):.1f} '
+                 f'{px(1):.1f},{py(0):.1f}" fill="none" stroke="black"/>')
+    points = " ".join(f"{px(x):.1f},{py(y):.1f}" for x, y in zip(xs, ys))
+    parts.append(f'<polyline points="{points}" fill="none" stroke="blue" stroke-width="2"/>')
+    for x, y in zip(xs, ys):
+        parts.append(f'<circle cx="{px(x):.1f}" cy="{py(y):.1f}" r="4" fill="blue"/>')
+    parts.append(f'<text x="{width / 2:.1f}" y="24" text-anchor="middle" font-size="14">'
+                 f'Schedulability vs Utilisation (RTA)</text>')
+    parts.append(f'<text x="{px(0.5):.1f}" y="{height - 15}" text-anchor="middle">Total Utilisation</text>')
+    parts.append(f'<text x="18" y="{py(0.525):.1f}" text-anchor="middle" '
+                 f'transform="rotate(-90 18 {py(0.525):.1f})">Schedulability Ratio</text>')
+    parts.append("</svg>")
+    
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(parts) + "\n")
+
+
 def plot_schedulability_vs_utilisation(
     results: dict,
-    output_path: str = "results/schedulability_vs_utilisation.png",
+    output_path: Optional[str] = None,
+    backend: str = "svg",
 ) -> None:
     """Plot schedulability ratio vs utilisation.
     
     Args:
         results: Dictionary mapping utilisation -> schedulability ratio.
-        output_path: Path to save the plot.
+        output_path: Path to save the plot (defaults to
+                     results/schedulability_vs_utilisation.svg, or .png for mpl).
+        backend: "svg" to write a standalone SVG, or "mpl" to render with matplotlib.
+    
+    Raises:
+        ValueError: If backend is unknown.
+        ImportError: If backend is "mpl" and matplotlib is not installed.
     """
-    if not MATPLOTLIB_AVAILABLE:
-        raise ImportError("matplotlib is required for plotting")
+    if backend not in ("svg", "mpl"):
+        raise ValueError(f"Unknown plot backend: {backend}")
+    
+    if output_path is None:
+        extension = "svg" if backend == "svg" else "png"
+        output_path = f"results/schedulability_vs_utilisation.{extension}"
     
     # Ensure output directory exists
     output_dir = Path(output_path).parent
@@ -93,6 +191,19 @@ def plot_schedulability_vs_utilisation(
     utilisations = sorted(results.keys())
     schedulability_ratios = [results[u] for u in utilisations]
     
+    if backend == "svg":
+        _write_svg(utilisations, schedulability_ratios, output_path)
+        print(f"Plot saved to {output_path}")
+        return
+    
+    # matplotlib is imported lazily: it is heavy and only needed for this backend
+    try:
+        import matplotlib
+        matplotlib.use('Agg')  # Non-interactive backend
+        import matplotlib.pyplot as plt
+    except ImportError as e:
+        raise ImportError("matplotlib is required for the mpl plot backend") from e
+    
     # Create plot
     plt.figure(figsize=(10, 6))
     plt.plot(utilisations, schedulability_ratios, 'bo-', linewidth=2, markersize=8)
@@ -112,6 +223,15 @@ def plot_schedulability_vs_utilisation(
 
 def main():
     """Run the full schedulability vs utilisation experiment."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--backend",
+        choices=("svg", "mpl"),
+        default="svg",
+        help="plot renderer: standalone SVG (default) or matplotlib PNG",
+    )
+    args = parser.parse_args()
+    
     print("Running schedulability vs utilisation experiment...")
     
     # Define utilisation points
@@ -133,7 +253,7 @@ def main():
         print(f"  U = {u:.1f}: {ratio:.3f} schedulable")
     
     # Plot results
-    plot_schedulability_vs_utilisation(results)
+    plot_schedulability_vs_utilisation(results, backend=args.backend)
     
     print("\nExperiment complete!")
 
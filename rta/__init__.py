@@ -5,7 +5,12 @@ task sets under fixed-priority preemptive scheduling on a single processor.
 """
 
 from rta.models import Task, TaskSet
-from rta.analysis import compute_response_time, is_schedulable, analyze_taskset
+from rta.analysis import (
+    compute_response_time,
+    is_schedulable,
+    satisfies_hyperbolic_bound,
+    analyze_taskset,
+)
 
 __version__ = "0.1.0"
 __all__ = [
@@ -13,5 +18,6 @@ __all__ = [
     "TaskSet",
     "compute_response_time",
     "is_schedulable",
+    "satisfies_hyperbolic_bound",
     "analyze_taskset",
 ]
@@ -0,0 +1,96 @@
+"""Numeric RTA kernels, JIT-compiled with numba when it is installed.
+
+The kernels take plain scalars and contiguous NumPy arrays only, so they
+compile in nopython mode; without numba they run as ordinary Python.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator used when numba is not installed (no-op)."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True)
+def _rta_kernel(
+    C_i: float,
+    D_i: float,
+    T_hp: np.ndarray,
+    C_hp: np.ndarray,
+    max_iterations: int,
+) -> float:
+    """Fixed-point iteration of RTA on plain floats and float64 arrays.
+    
+    JIT-compiled with numba when available, otherwise runs as plain Python.
+    
+    Returns:
+        The converged response time, or -1.0 if the deadline is exceeded
+        or the iteration does not converge within max_iterations.
+    """
+    # Warm start: each higher-priority task preempts at least once
+    R_prev = C_i
+    for k in range(C_hp.shape[0]):
+        R_prev += C_hp[k]
+    
+    for _ in range(max_iterations):
+        interference = 0.0
+        for k in range(T_hp.shape[0]):
+            interference += math.ceil(R_prev / T_hp[k]) * C_hp[k]
+        
+        R_new = C_i + interference
+        if R_new > D_i:
+            return -1.0
+        if abs(R_new - R_prev) < 1e-9:
+            return R_new
+        
+        R_prev = R_new
+    
+    return -1.0
+
+
+@njit(cache=True)
+def _rta_kernel_int(
+    C_i: int,
+    D_i: int,
+    T_hp: np.ndarray,
+    C_hp: np.ndarray,
+    max_iterations: int,
+) -> int:
+    """Fixed-point iteration of RTA on integers and int64 arrays.
+    
+    Same iteration as _rta_kernel, but ceil(R / T_j) is computed exactly as
+    (R + T_j - 1) // T_j and convergence is exact equality.
+    
+    Returns:
+        The converged response time, or -1 if the deadline is exceeded
+        or the iteration does not converge within max_iterations.
+    """
+    # Warm start: each higher-priority task preempts at least once
+    R_prev = C_i
+    for k in range(C_hp.shape[0]):
+        R_prev += C_hp[k]
+    
+    for _ in range(max_iterations):
+        interference = 0
+        for k in range(T_hp.shape[0]):
+            interference += (R_prev + T_hp[k] - 1) // T_hp[k] * C_hp[k]
+        
+        R_new = C_i + interference
+        if R_new > D_i:
+            return -1
+        if R_new == R_prev:
+            return R_new
+        
+        R_prev = R_new
+    
+    return -1
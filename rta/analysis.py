@@ -13,7 +13,9 @@ where:
     - T_j is the period of task j
     - C_j is the worst-case execution time of task j
 
-The iteration starts with R_i^(0) = C_i and continues until either:
+The iteration starts with R_i^(0) = C_i + sum_{j in hp(i)} C_j (a valid lower
+bound, since every higher-priority task is released at the critical instant)
+and continues until either:
     1. Convergence: R_i^(k+1) = R_i^(k)
     2. Deadline miss: R_i^(k+1) > D_i
 
@@ -26,12 +28,82 @@ Assumptions:
     - Priority assignment: Rate Monotonic (shorter period = higher priority)
 """
 
-from typing import Optional, Dict, Tuple
+from fractions import Fraction
+from typing import Optional, Dict, List, Tuple
+import functools
 import math
+from operator import attrgetter
 
+import numpy as np
+
+from rta._analysis_numba import NUMBA_AVAILABLE, _rta_kernel, _rta_kernel_int
 from rta.models import Task, TaskSet
 
 
+# Integer RTA is used only while scaled values stay well inside int64,
+# leaving headroom for the interference sum of up to n tasks
+_INT64_HEADROOM = 2**62
+
+# Largest common scale tried for integer RTA. Any float is a dyadic rational,
+# but arbitrary floats need scales near 2**50 whose exact conversion costs
+# more than it saves; this keeps the integer path for integer and
+# short-fraction parameters
+_MAX_INT_SCALE = 2**20
+
+
+def _scale_to_integers(
+    C: List[float],
+    T: List[float],
+    D: List[float],
+) -> Optional[Tuple[int, List[int], List[int], List[int]]]:
+    """Scale task parameters by a common factor so they become exact integers.
+    
+    Each C, T and D is converted to an exact Fraction and multiplied by the
+    least common multiple of the denominators.
+    
+    Args:
+        C: WCETs.
+        T: Periods.
+        D: Deadlines.
+    
+    Returns:
+        A tuple of (scale, C, T, D) with integer lists in the same order,
+        or None if no small enough common scale exists.
+    """
+    if not C:
+        return 1, [], [], []
+    
+    # Cheap rejection before any Fraction work: a float's denominator is a
+    # power of two, so it divides _MAX_INT_SCALE exactly when scaling by it
+    # gives a whole number
+    for column in (C, T, D):
+        for value in column:
+            if isinstance(value, float) and not (value * _MAX_INT_SCALE).is_integer():
+                return None
+    
+    # Give up as soon as the growing scale would push the largest parameter
+    # past the limit; arbitrary floats fail on their first value
+    limit = min(
+        _MAX_INT_SCALE,
+        _INT64_HEADROOM // ((len(C) + 1) * max(1, math.ceil(max(T)))),
+    )
+    
+    fractions = []
+    scale = 1
+    for column in (C, T, D):
+        column_fractions = []
+        for value in column:
+            value = Fraction(value)
+            scale = math.lcm(scale, value.denominator)
+            if scale > limit:
+                return None
+            column_fractions.append(value)
+        fractions.append(column_fractions)
+    
+    C_int, T_int, D_int = ([int(value * scale) for value in column] for column in fractions)
+    return scale, C_int, T_int, D_int
+
+
 def compute_response_time(
     task: Task,
     higher_priority_tasks: list[Task],
@@ -42,11 +114,15 @@ def compute_response_time(
     Uses the standard fixed-point iteration:
         R_i^(k+1) = C_i + sum_{j in hp(i)} ceil(R_i^(k) / T_j) * C_j
     
-    The iteration starts with R_i^(0) = C_i and continues until either:
+    The iteration starts with R_i^(0) = C_i + sum_{j in hp(i)} C_j and
+    continues until either:
         1. Convergence: |R_i^(k+1) - R_i^(k)| < epsilon
         2. Deadline miss: R_i^(k+1) > D_i
         3. Max iterations reached (returns None)
     
+    Results are memoized on (C_i, D_i, higher-priority (C, T) pairs), so
+    repeated sub-problems skip the iteration.
+    
     Args:
         task: The task to analyze.
         higher_priority_tasks: List of tasks with higher priority than task.
@@ -56,32 +132,29 @@ def compute_response_time(
         The worst-case response time if it converges and is <= D,
         None if the task is unschedulable (R > D or doesn't converge).
     """
-    # Initial response time is just the task's own execution time
-    R_prev = task.C
-    
-    for iteration in range(max_iterations):
-        # Compute interference from higher-priority tasks
-        interference = 0.0
-        for hp_task in higher_priority_tasks:
-            # Number of times hp_task can preempt during R_prev
-            num_preemptions = math.ceil(R_prev / hp_task.T)
-            interference += num_preemptions * hp_task.C
-        
-        # New response time estimate
-        R_new = task.C + interference
-        
-        # Check if response time exceeds deadline
-        if R_new > task.D:
-            return None  # Unschedulable
-        
-        # Check for convergence
-        if abs(R_new - R_prev) < 1e-9:  # Use small epsilon for floating-point comparison
-            return R_new
-        
-        R_prev = R_new
+    # With no higher-priority tasks there is no interference
+    if not higher_priority_tasks:
+        return task.C
+    
+    # Interference does not depend on the order of hp tasks; sorting gives a
+    # canonical key so identical sub-problems share one cache entry
+    hp = tuple(sorted((t.C, t.T) for t in higher_priority_tasks))
+    return _response_time_cached(task.C, task.D, hp, max_iterations)
+
+
+@functools.lru_cache(maxsize=65536)
+def _response_time_cached(
+    C_i: float,
+    D_i: float,
+    hp: Tuple[Tuple[float, float], ...],
+    max_iterations: int,
+) -> Optional[float]:
+    """Memoized RTA for one task given its (C, T) higher-priority pairs."""
+    C_hp = np.array([c for c, _ in hp], dtype=np.float64)
+    T_hp = np.array([t for _, t in hp], dtype=np.float64)
     
-    # Did not converge within max_iterations
-    return None
+    R = _rta_kernel(float(C_i), float(D_i), T_hp, C_hp, max_iterations)
+    return None if R < 0.0 else R
 
 
 def is_schedulable(task: Task, higher_priority_tasks: list[Task]) -> bool:
@@ -101,15 +174,198 @@ def is_schedulable(task: Task, higher_priority_tasks: list[Task]) -> bool:
     return response_time is not None
 
 
-def analyze_taskset(taskset: TaskSet) -> Tuple[bool, Dict[str, Optional[float]]]:
+def satisfies_hyperbolic_bound(taskset: TaskSet) -> bool:
+    """Check the hyperbolic bound, a sufficient test for Rate Monotonic.
+    
+    Under RM with implicit deadlines (D = T), a task set is schedulable if
+        prod_i (1 + C_i / T_i) <= 2
+    
+    This costs a single O(n) product, so it can be used to accept task sets
+    before running the exact (iterative) analysis. A False result is
+    inconclusive. The bound is only applied when every task has D = T and
+    priorities follow Rate Monotonic order; otherwise False is returned.
+    
+    Reference:
+    Bini, E., Buttazzo, G. C., & Buttazzo, G. M. (2003). Rate monotonic analysis:
+    the hyperbolic bound. IEEE Transactions on Computers, 52(7), 933-942.
+    
+    Args:
+        taskset: The task set to check.
+    
+    Returns:
+        True if the task set is guaranteed schedulable by the bound.
+    """
+    bound = 1.0
+    prev_period = 0.0
+    
+    for task in taskset.get_sorted_tasks():
+        # Only valid for implicit deadlines under RM priority order
+        if task.D != task.T or task.T < prev_period:
+            return False
+        prev_period = task.T
+        
+        bound *= 1.0 + task.C / task.T
+        if bound > 2.0:
+            return False
+    
+    return True
+
+
+# Largest task set size handled by a generated analyzer. They beat per-task
+# calls into the numba kernel only for small n, and beat the pure-Python
+# kernel at every size generated here
+_MAX_SPECIALISED_TASKS = 8 if NUMBA_AVAILABLE else 32
+
+
+@functools.lru_cache(maxsize=64)
+def _make_analyzer(n: int, integer: bool):
+    """Generate an RTA function specialised for n tasks with distinct priorities.
+    
+    The source is emitted with n fixed: parameters are unpacked into locals
+    and each task's interference sum is written out term by term, so the
+    generated code has no inner loops or array indexing. With integer=True,
+    ceil(R / T_j) is computed exactly as -(-R // T_j) and convergence is
+    exact equality; otherwise math.ceil and the usual epsilon are used.
+    
+    The returned function takes (C, T, D, max_iterations, short_circuit),
+    with parameter sequences in priority order, and returns
+    (schedulable, response_times) like _analyze_signature (unscaled).
+    """
+    ceil_term = "-(-R // T{j}) * C{j}" if integer else "ceil(R / T{j}) * C{j}"
+    converged = "R_new == R" if integer else "abs(R_new - R) < 1e-9"
+    
+    names = ", ".join(f"C{i}" for i in range(n))
+    lines = [f"def analyze_n{n}(C, T, D, max_iterations, short_circuit):"]
+    if n:
+        lines += [
+            f"    {names}, = C",
+            f"    {names.replace('C', 'T')}, = T",
+            f"    {names.replace('C', 'D')}, = D",
+        ]
+    lines += ["    rts = []"]
+    
+    for i in range(n):
+        interference = " + ".join(ceil_term.format(j=j) for j in range(i)) or "0"
+        warm_start = " + ".join(f"C{j}" for j in range(i + 1))
+        lines += [
+            f"    R = {warm_start}",
+            "    for _ in range(max_iterations):",
+            f"        R_new = C{i} + {interference}",
+            f"        if R_new > D{i}:",
+            "            R = None",
+            "            break",
+            f"        if {converged}:",
+            "            R = R_new",
+            "            break",
+            "        R = R_new",
+            "    else:",
+            "        R = None",
+            "    rts.append(R)",
+            "    if R is None and short_circuit:",
+            "        return False, tuple(rts)",
+        ]
+    
+    lines += ["    return None not in rts, tuple(rts)"]
+    
+    namespace = {"ceil": math.ceil}
+    exec(compile("\n".join(lines), f"<rta analyzer n={n}>", "exec"), namespace)
+    return namespace[f"analyze_n{n}"]
+
+
+# Per-task (C, T, D, priority) tuple making up a task set's signature
+_signature_fields = attrgetter('C', 'T', 'D', 'priority')
+
+
+@functools.lru_cache(maxsize=4096)
+def _analyze_signature(
+    signature: Tuple[Tuple[float, float, float, int], ...],
+    max_iterations: int,
+    short_circuit: bool,
+) -> Tuple[bool, Tuple[Optional[float], ...]]:
+    """Run RTA on a canonical task set signature.
+    
+    The signature is the tuple of (C, T, D, priority) per task in priority
+    order, so identical task sets share one cached result.
+    
+    Returns:
+        A tuple of (schedulable, response_times) with response times in
+        priority order (None if unschedulable).
+    """
+    n = len(signature)
+    C = [task[0] for task in signature]
+    T = [task[1] for task in signature]
+    D = [task[2] for task in signature]
+    
+    int_params = _scale_to_integers(C, T, D)
+    
+    # Small task sets with distinct priorities use a generated analyzer
+    distinct = all(signature[i][3] != signature[i - 1][3] for i in range(1, n))
+    if 0 < n <= _MAX_SPECIALISED_TASKS and distinct:
+        if int_params is not None:
+            scale, C_int, T_int, D_int = int_params
+            analyzer = _make_analyzer(n, True)
+            all_schedulable, rts = analyzer(C_int, T_int, D_int, max_iterations, short_circuit)
+            return all_schedulable, tuple(None if R is None else R / scale for R in rts)
+        return _make_analyzer(n, False)(C, T, D, max_iterations, short_circuit)
+    
+    if int_params is not None:
+        scale, C_int, T_int, D_int = int_params
+        C_arr, T_arr, D_arr = (np.array(v, dtype=np.int64) for v in (C_int, T_int, D_int))
+        kernel = _rta_kernel_int
+    else:
+        scale = None
+        C_arr, T_arr, D_arr = (np.array(v, dtype=np.float64) for v in (C, T, D))
+        kernel = _rta_kernel
+    
+    response_times: List[Optional[float]] = []
+    all_schedulable = True
+    
+    # Higher-priority tasks are a prefix of the priority-sorted arrays,
+    # so each task's interference comes from a slice
+    num_hp = 0
+    for i in range(n):
+        # Tasks sharing a priority level do not preempt each other
+        if i > 0 and signature[i][3] != signature[i - 1][3]:
+            num_hp = i
+        
+        R = kernel(C_arr[i], D_arr[i], T_arr[:num_hp], C_arr[:num_hp], max_iterations)
+        if R < 0:
+            rt = None
+        else:
+            rt = R / scale if scale is not None else R
+        
+        response_times.append(rt)
+        
+        if rt is None:
+            all_schedulable = False
+            if short_circuit:
+                break
+    
+    return all_schedulable, tuple(response_times)
+
+
+def analyze_taskset(
+    taskset: TaskSet,
+    max_iterations: int = 1000,
+    short_circuit: bool = False,
+) -> Tuple[bool, Dict[str, Optional[float]]]:
     """Analyze the schedulability of an entire task set.
     
     Performs response-time analysis on each task in priority order
     (highest priority first). A task set is schedulable if all tasks
     meet their deadlines.
     
+    When all parameters can be scaled to exact integers by a common factor
+    (e.g. integer or dyadic C, T, D), the exact integer kernel is used;
+    otherwise the floating-point analysis is used. Results are memoized on
+    the task parameters, so re-analysing an identical task set is a lookup.
+    
     Args:
         taskset: The task set to analyze.
+        max_iterations: Maximum number of RTA iterations per task.
+        short_circuit: If True, stop at the first task that misses its
+                       deadline; response_times then only covers the tasks
+                       analysed so far.
     
     Returns:
         A tuple of (schedulable, response_times) where:
@@ -118,17 +374,13 @@ def analyze_taskset(taskset: TaskSet) -> Tuple[bool, Dict[str, Optional[float]]]
                          (None if unschedulable).
     """
     sorted_tasks = taskset.get_sorted_tasks()
-    response_times: Dict[str, Optional[float]] = {}
-    all_schedulable = True
+    signature = tuple(map(_signature_fields, sorted_tasks))
     
-    for task in sorted_tasks:
-        hp_tasks = taskset.get_higher_priority_tasks(task)
-        rt = compute_response_time(task, hp_tasks)
-        
+    all_schedulable, rts = _analyze_signature(signature, max_iterations, short_circuit)
+    
+    response_times: Dict[str, Optional[float]] = {}
+    for task, rt in zip(sorted_tasks, rts):
         task_name = task.name if task.name else f"Task_prio_{task.priority}"
         response_times[task_name] = rt
-        
-        if rt is None:
-            all_schedulable = False
     
     return all_schedulable, response_times
@@ -1,8 +1,9 @@
 """Task set generators for testing and experiments."""
 
-import random
 from typing import List, Optional
+import functools
 import math
+import random
 
 from rta.models import Task, TaskSet
 
@@ -33,12 +34,13 @@ def uunifast(n: int, u_total: float, seed: Optional[int] = None) -> List[float]:
     if u_total < 0:
         raise ValueError("Target utilization must be non-negative")
     
-    # Create Random instance from seed
-    rng = random.Random(seed) if seed is not None else random.Random()
-    
+    return _uunifast(n, u_total, random.Random(seed))
+
+
+def _uunifast(n: int, u_total: float, rng: random.Random) -> List[float]:
+    """Run UUniFast for n >= 1 tasks, drawing from the given generator."""
     utilizations = []
     sum_u = u_total
-    
     for i in range(1, n):
         # Generate next utilization
         next_sum_u = sum_u * (rng.random() ** (1.0 / (n - i)))
@@ -47,7 +49,6 @@ def uunifast(n: int, u_total: float, seed: Optional[int] = None) -> List[float]:
     
     # Last utilization is whatever remains
     utilizations.append(sum_u)
-    
     return utilizations
 
 
@@ -84,17 +85,18 @@ def generate_random_task_set_uunifast(
     if u_total < 0:
         raise ValueError("Target utilization must be non-negative")
     
-    # Create Random instance from seed
-    rng = random.Random(seed) if seed is not None else random.Random()
+    # One generator feeds both UUniFast and the period draws
+    rng = random.Random(seed)
+    
+    # Generate utilizations using UUniFast
+    utilizations = _uunifast(n, u_total, rng)
     
-    # Generate utilizations using UUniFast with same seed
-    utilizations = uunifast(n, u_total, seed=seed)
+    log_min = math.log(min_period)
+    log_max = math.log(max_period)
     
     tasks = []
     for i, u in enumerate(utilizations):
         # Generate random period (log-uniform distribution)
-        log_min = math.log(min_period)
-        log_max = math.log(max_period)
         T = math.exp(rng.uniform(log_min, log_max))
         
         # Compute WCET from utilization
@@ -145,28 +147,59 @@ def generate_taskset(
         seed: Random seed for reproducibility.
     
     Returns:
-        A TaskSet with n tasks.
+        A TaskSet with n tasks. Task sets generated with a seed are cached
+        and shared between calls with the same arguments (task sets are
+        immutable, so this is safe); generate_taskset.cache_clear() drops
+        them.
     
     Raises:
         ValueError: If parameters are invalid.
     """
+    # Without a seed every call must draw a fresh task set
+    if seed is None:
+        return _generate_taskset(
+            n, target_utilization, period_min, period_max,
+            deadline_factor_min, deadline_factor_max, seed,
+        )
+    return _generate_taskset_cached(
+        n, target_utilization, period_min, period_max,
+        deadline_factor_min, deadline_factor_max, seed,
+    )
+
+
+def _generate_taskset(
+    n: int,
+    target_utilization: float,
+    period_min: float,
+    period_max: float,
+    deadline_factor_min: float,
+    deadline_factor_max: float,
+    seed: Optional[int],
+) -> TaskSet:
+    """Build a task set for generate_taskset (see there for arguments)."""
     if period_min <= 0 or period_max <= 0 or period_min > period_max:
         raise ValueError("Invalid period range")
     if deadline_factor_min <= 0 or deadline_factor_max < deadline_factor_min:
         raise ValueError("Invalid deadline factor range")
     if deadline_factor_max > 1.0:
         raise ValueError("Deadline factor cannot exceed 1.0 (D must be <= T)")
+    if n <= 0:
+        raise ValueError("Number of tasks must be positive")
+    if target_utilization < 0:
+        raise ValueError("Target utilization must be non-negative")
+    
+    # One generator feeds both UUniFast and the period draws
+    rng = random.Random(seed)
     
-    rng = random.Random(seed) if seed is not None else random.Random()
+    # Generate utilizations using UUniFast
+    utilizations = _uunifast(n, target_utilization, rng)
     
-    # Generate utilizations using UUniFast with same seed
-    utilizations = uunifast(n, target_utilization, seed=seed)
+    log_min = math.log(period_min)
+    log_max = math.log(period_max)
     
     tasks = []
     for i, u in enumerate(utilizations):
         # Generate random period (log-uniform distribution)
-        log_min = math.log(period_min)
-        log_max = math.log(period_max)
         T = math.exp(rng.uniform(log_min, log_max))
         
         # Compute WCET from utilization
@@ -192,3 +225,8 @@ def generate_taskset(
         tasks.append(task)
     
     return TaskSet(tasks=tasks)
+
+
+# Generation is deterministic in the seed, so seeded task sets are memoized
+_generate_taskset_cached = functools.lru_cache(maxsize=4096)(_generate_taskset)
+generate_taskset.cache_clear = _generate_taskset_cached.cache_clear
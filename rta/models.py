@@ -1,13 +1,37 @@
 """Data models for tasks and task sets."""
 
-from dataclasses import dataclass, field
-from typing import List, Optional
+from dataclasses import FrozenInstanceError, dataclass, field
+from operator import attrgetter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+def _diagnose_task_params(C: float, T: float, D: float, name: str) -> str:
+    """Return the error message for the first violated task constraint."""
+    if not C > 0:
+        return f"Task {name}: C must be positive, got {C}"
+    if not T > 0:
+        return f"Task {name}: T must be positive, got {T}"
+    if not C <= T:
+        return f"Task {name}: C ({C}) cannot exceed T ({T})"
+    if not D > 0:
+        return f"Task {name}: D must be positive, got {D}"
+    if not D <= T:
+        return f"Task {name}: D ({D}) cannot exceed T ({T})"
+    if not C <= D:
+        return f"Task {name}: C ({C}) cannot exceed D ({D})"
+    return f"Task {name}: invalid parameters C={C}, T={T}, D={D}"
 
 
-@dataclass(frozen=True)
 class Task:
     """Represents a periodic or sporadic task.
     
+    Tasks use __slots__ rather than a frozen dataclass to keep construction
+    cheap and instances small. They are still immutable: assigning to a field
+    raises FrozenInstanceError, so cached values derived from the fields
+    (utilization, string form, hash and TaskSet arrays) cannot go stale.
+    
     Attributes:
         C: Worst-case execution time (WCET).
         T: Period (or minimum inter-arrival time).
@@ -16,110 +40,279 @@ class Task:
         priority: Task priority (lower value = higher priority).
                   If not set, will be assigned by TaskSet based on Rate Monotonic.
     """
-    C: float
-    T: float
-    D: Optional[float] = None
-    name: str = ""
-    priority: Optional[int] = None
+    __slots__ = ('C', 'T', 'D', 'name', 'priority', '_U', '_str')
     
-    def __post_init__(self) -> None:
-        """Validate task parameters."""
-        if self.C <= 0:
-            raise ValueError(f"Task {self.name}: C must be positive, got {self.C}")
-        if self.T <= 0:
-            raise ValueError(f"Task {self.name}: T must be positive, got {self.T}")
-        if self.C > self.T:
-            raise ValueError(f"Task {self.name}: C ({self.C}) cannot exceed T ({self.T})")
-        
+    def __init__(
+        self,
+        C: float,
+        T: float,
+        D: Optional[float] = None,
+        name: str = "",
+        priority: Optional[int] = None,
+    ) -> None:
+        """Validate and store task parameters."""
         # Set default deadline to period if not specified
-        if self.D is None:
-            object.__setattr__(self, 'D', self.T)
-        elif self.D <= 0:
-            raise ValueError(f"Task {self.name}: D must be positive, got {self.D}")
-        elif self.D > self.T:
-            raise ValueError(f"Task {self.name}: D ({self.D}) cannot exceed T ({self.T})")
+        if D is None:
+            D = T
+        
+        # 0 < C <= D <= T covers every constraint; work out which one was
+        # violated only on the error path
+        if not (0 < C <= D <= T):
+            raise ValueError(_diagnose_task_params(C, T, D, name))
         
-        if self.C > self.D:
-            raise ValueError(f"Task {self.name}: C ({self.C}) cannot exceed D ({self.D})")
+        _set = object.__setattr__
+        _set(self, 'C', C)
+        _set(self, 'T', T)
+        _set(self, 'D', D)
+        _set(self, 'name', name)
+        _set(self, 'priority', priority)
+        # Cache utilization
+        _set(self, '_U', C / T)
+        # String form, built on first use
+        _set(self, '_str', None)
+    
+    def _with_priority(self, priority: int, name: str) -> "Task":
+        """Return a copy with the given priority and name.
+        
+        The parameters were validated when this task was created, so the copy
+        is filled in directly instead of going through __init__.
+        """
+        task = Task.__new__(Task)
+        _set = object.__setattr__
+        _set(task, 'C', self.C)
+        _set(task, 'T', self.T)
+        _set(task, 'D', self.D)
+        _set(task, 'name', name)
+        _set(task, 'priority', priority)
+        _set(task, '_U', self._U)
+        _set(task, '_str', None)
+        return task
+    
+    def __setattr__(self, name: str, value: object) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+    
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+    
+    def __reduce__(self) -> tuple:
+        # The default slot-state restore would go through __setattr__
+        return (Task, (self.C, self.T, self.D, self.name, self.priority))
+    
+    def _key(self) -> tuple:
+        return (self.C, self.T, self.D, self.name, self.priority)
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Task):
+            return NotImplemented
+        return self._key() == other._key()
+    
+    def __hash__(self) -> int:
+        return hash(self._key())
+    
+    def __repr__(self) -> str:
+        return (
+            f"Task(C={self.C!r}, T={self.T!r}, D={self.D!r}, "
+            f"name={self.name!r}, priority={self.priority!r})"
+        )
     
     @property
     def utilization(self) -> float:
         """Return the utilization of this task (C/T)."""
-        return self.C / self.T
+        return self._U
     
     def __str__(self) -> str:
-        name_str = f"{self.name}: " if self.name else ""
-        return f"Task({name_str}C={self.C}, T={self.T}, D={self.D}, prio={self.priority})"
+        # Built once and reused, since traces may print the same task many times
+        if self._str is None:
+            name_str = f"{self.name}: " if self.name else ""
+            object.__setattr__(
+                self, '_str', f"Task({name_str}C={self.C}, T={self.T}, D={self.D}, prio={self.priority})"
+            )
+        return self._str
 
 
-@dataclass
+@dataclass(frozen=True)
 class TaskSet:
     """Represents a set of tasks with priority assignment.
     
+    Task sets are frozen: tasks cannot be replaced after construction, so
+    the sorted order, arrays and cached utilization always describe them.
+    
+    Tasks keep the order they were given in; the priority order is stored
+    separately as a permutation, so indices into tasks stay valid. The task
+    parameters are also available as parallel NumPy arrays (C, T, D,
+    priority) in priority order; they are built on first use, since the
+    analysis itself works on the sorted tasks.
+    
     Attributes:
-        tasks: List of tasks in the set.
-        _sorted: Whether tasks are sorted by priority.
+        tasks: Tasks in the set, in the order given; stored as a tuple.
+        _total_u: Cached total utilization (None until first requested).
     """
-    tasks: List[Task] = field(default_factory=list)
-    _sorted: bool = field(default=False, init=False, repr=False)
+    tasks: Sequence[Task] = field(default_factory=tuple)
+    _total_u: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    
+    # Parameter arrays and lookups are built on first use; until then these
+    # class-level defaults are seen (they are not dataclass fields)
+    _arrays = None
+    _by_name = None
+    _by_prio = None
     
     def __post_init__(self) -> None:
         """Assign priorities using Rate Monotonic if not already set."""
-        if not self.tasks:
-            return
+        # The dataclass is frozen, so internal state is set directly
+        object.__setattr__(self, 'tasks', tuple(self.tasks))
         
-        # Check if all tasks have priorities assigned
-        if all(t.priority is not None for t in self.tasks):
-            self._sorted = False
-            return
+        # Count assigned priorities in a single pass
+        priorities = [t.priority for t in self.tasks]
+        num_set = len(priorities) - priorities.count(None)
         
-        # Check if none have priorities (we'll assign them)
-        if all(t.priority is None for t in self.tasks):
+        if num_set == len(self.tasks):
+            # All tasks have priorities assigned (or the set is empty):
+            # sort once by priority so later lookups never need to
+            self._set_sort_order(sorted(range(len(self.tasks)), key=priorities.__getitem__))
+        elif num_set == 0:
+            # None have priorities (we'll assign them)
             self._assign_rate_monotonic_priorities()
-            return
+        else:
+            # Mixed case: some have priorities, some don't
+            raise ValueError("Either all tasks must have priorities set, or none should.")
+    
+    def _set_sort_order(self, order: List[int]) -> None:
+        """Record the priority order of the tasks.
         
-        # Mixed case: some have priorities, some don't
-        raise ValueError("Either all tasks must have priorities set, or none should.")
+        The tasks themselves are left in the order given; _sort_order maps
+        each rank (0 = highest priority) to an index into tasks.
+        """
+        _set = object.__setattr__
+        _set(self, '_sort_order', tuple(order))
+        _set(self, '_sorted_tasks', tuple([self.tasks[i] for i in order]))
     
     def _assign_rate_monotonic_priorities(self) -> None:
-        """Assign priorities using Rate Monotonic (shorter period = higher priority)."""
-        # Sort by period (ascending)
-        sorted_tasks = sorted(self.tasks, key=lambda t: t.T)
+        """Assign priorities using Rate Monotonic (shorter period = higher priority).
         
-        # Assign priorities (0 = highest)
-        new_tasks = []
-        for i, task in enumerate(sorted_tasks):
-            new_task = Task(
-                C=task.C,
-                T=task.T,
-                D=task.D,
-                name=task.name if task.name else f"τ{i+1}",
-                priority=i
-            )
-            new_tasks.append(new_task)
+        The given Task objects are left unchanged; the set holds copies with
+        priorities (and default names) assigned.
+        """
+        # Sort by period (ascending); sorted() is stable, so equal periods
+        # keep their order
+        periods = [t.T for t in self.tasks]
+        order = sorted(range(len(self.tasks)), key=periods.__getitem__)
         
-        self.tasks = new_tasks
-        self._sorted = True
+        # Assign priorities (0 = highest) on copies; the tasks were already
+        # validated on construction, so the copies skip validation
+        tasks = list(self.tasks)
+        for i, index in enumerate(order):
+            task = tasks[index]
+            tasks[index] = task._with_priority(i, task.name or f"τ{i+1}")
+        object.__setattr__(self, 'tasks', tuple(tasks))
+        self._set_sort_order(order)
+    
+    def _build_index(self) -> None:
+        """Build name and priority lookups over the sorted task list."""
+        object.__setattr__(self, '_by_name', {t.name: t for t in self._sorted_tasks})
+        # Rank where each priority level starts; for Rate Monotonic
+        # priorities 0..n-1 this is the priority itself
+        by_prio: Dict[int, int] = {}
+        for i, task in enumerate(self._sorted_tasks):
+            by_prio.setdefault(task.priority, i)
+        object.__setattr__(self, '_by_prio', by_prio)
     
-    def get_sorted_tasks(self) -> List[Task]:
-        """Return tasks sorted by priority (highest priority first)."""
-        if not self._sorted:
-            self.tasks.sort(key=lambda t: t.priority if t.priority is not None else float('inf'))
-            self._sorted = True
-        return self.tasks
+    def _parameter_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Return read-only (C, T, D, priority) arrays in priority order.
+        
+        The arrays are built on first use and shared with callers afterwards.
+        """
+        if self._arrays is None:
+            sorted_tasks = self._sorted_tasks
+            arrays = (
+                np.array([t.C for t in sorted_tasks], dtype=np.float64),
+                np.array([t.T for t in sorted_tasks], dtype=np.float64),
+                np.array([t.D for t in sorted_tasks], dtype=np.float64),
+                np.array([t.priority for t in sorted_tasks], dtype=np.int64),
+            )
+            for array in arrays:
+                array.flags.writeable = False
+            object.__setattr__(self, '_arrays', arrays)
+        return self._arrays
     
-    def get_higher_priority_tasks(self, task: Task) -> List[Task]:
+    def get_sorted_tasks(self) -> Sequence[Task]:
+        """Return tasks sorted by priority (highest priority first).
+        
+        The sorted order is computed once during construction, so this is a
+        plain accessor; tasks itself is left in the order given.
+        """
+        return self._sorted_tasks
+    
+    def get_higher_priority_tasks(self, task: Task) -> Sequence[Task]:
         """Return all tasks with higher priority than the given task."""
         if task.priority is None:
             raise ValueError(f"Task {task.name} has no priority assigned")
         
+        # Higher-priority tasks form a prefix of the sorted order
         sorted_tasks = self.get_sorted_tasks()
-        return [t for t in sorted_tasks if t.priority is not None and t.priority < task.priority]
+        if self._by_prio is None:
+            self._build_index()
+        num_hp = self._by_prio.get(task.priority)
+        if num_hp is None:
+            # Priority level not present in this set (e.g. a foreign task)
+            return tuple(t for t in sorted_tasks if t.priority < task.priority)
+        return sorted_tasks[:num_hp]
+    
+    def get_hp_arrays(self, task: Task) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (C, T) arrays of all tasks with higher priority than the given task.
+        
+        The arrays are read-only, contiguous slices of C_arr and T_arr.
+        """
+        if task.priority is None:
+            raise ValueError(f"Task {task.name} has no priority assigned")
+        
+        C, T, _, priority = self._parameter_arrays()
+        if self._by_prio is None:
+            self._build_index()
+        num_hp = self._by_prio.get(task.priority)
+        if num_hp is None:
+            # Priority level not present in this set; priorities are sorted
+            num_hp = int(np.searchsorted(priority, task.priority, side="left"))
+        return C[:num_hp], T[:num_hp]
+    
+    def get(self, name: str) -> Optional[Task]:
+        """Return the task with the given name, or None if there is none."""
+        if self._by_name is None:
+            self._build_index()
+        return self._by_name.get(name)
+    
+    def as_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, List[str]]:
+        """Return task parameters as arrays in priority order (highest first).
+        
+        The arrays are shared with the task set and are read-only.
+        
+        Returns:
+            A tuple of (C, T, D, priority, names) where C, T and D are float64
+            arrays, priority is an int64 array and names is a list of task names.
+        """
+        names = list(map(attrgetter('name'), self.get_sorted_tasks()))
+        return (*self._parameter_arrays(), names)
+    
+    @property
+    def C_arr(self) -> np.ndarray:
+        """Return WCETs as a float64 array in priority order (highest first)."""
+        return self._parameter_arrays()[0]
+    
+    @property
+    def T_arr(self) -> np.ndarray:
+        """Return periods as a float64 array in priority order (highest first)."""
+        return self._parameter_arrays()[1]
+    
+    @property
+    def D_arr(self) -> np.ndarray:
+        """Return deadlines as a float64 array in priority order (highest first)."""
+        return self._parameter_arrays()[2]
     
     @property
     def total_utilization(self) -> float:
-        """Return the total utilization of all tasks."""
-        return sum(t.utilization for t in self.tasks)
+        """Return the total utilization of all tasks (computed once, then cached)."""
+        if self._total_u is None:
+            object.__setattr__(self, '_total_u', sum(t.utilization for t in self.tasks))
+        return self._total_u
     
     def __len__(self) -> int:
         return len(self.tasks)
@@ -1,8 +1,19 @@
 """Hand-crafted unit tests for base-case RTA."""
 
+import copy
+import pickle
 import unittest
+from dataclasses import FrozenInstanceError
+from unittest import mock
+
+import rta.analysis
 from rta.models import Task, TaskSet
-from rta.analysis import compute_response_time, is_schedulable, analyze_taskset
+from rta.analysis import (
+    compute_response_time,
+    is_schedulable,
+    satisfies_hyperbolic_bound,
+    analyze_taskset,
+)
 
 
 class TestTask(unittest.TestCase):
@@ -79,6 +90,19 @@ class TestTask(unittest.TestCase):
         task = Task(C=5.0, T=10.0, D=5.0)
         self.assertEqual(task.C, 5.0)
         self.assertEqual(task.D, 5.0)
+    
+    def test_task_is_immutable(self):
+        """Test that task fields cannot be reassigned after creation."""
+        task = Task(C=1.0, T=10.0)
+        with self.assertRaises(FrozenInstanceError):
+            task.C = 9.0
+        with self.assertRaises(FrozenInstanceError):
+            task.priority = 0
+        self.assertEqual(task.utilization, 0.1)
+        
+        # Copies and pickles are rebuilt through the constructor
+        self.assertEqual(pickle.loads(pickle.dumps(task)), task)
+        self.assertEqual(copy.copy(task), task)
 
 
 class TestTaskSet(unittest.TestCase):
@@ -151,11 +175,129 @@ class TestTaskSet(unittest.TestCase):
         hp_tasks = taskset.get_higher_priority_tasks(sorted_tasks[0])
         self.assertEqual(len(hp_tasks), 0)
     
+    def test_get_higher_priority_tasks_explicit_priorities(self):
+        """Test higher-priority lookup with user-assigned, non-dense priorities."""
+        tasks = [
+            Task(C=1.0, T=20.0, name="low", priority=7),
+            Task(C=1.0, T=10.0, name="high", priority=2),
+            Task(C=1.0, T=15.0, name="mid_a", priority=4),
+            Task(C=1.0, T=15.0, name="mid_b", priority=4),
+        ]
+        taskset = TaskSet(tasks=tasks)
+        by_name = {t.name: t for t in taskset}
+        
+        hp_names = lambda name: [t.name for t in taskset.get_higher_priority_tasks(by_name[name])]
+        self.assertEqual(hp_names("high"), [])
+        # Tasks sharing a priority level do not count as higher priority
+        self.assertEqual(hp_names("mid_a"), ["high"])
+        self.assertEqual(hp_names("mid_b"), ["high"])
+        self.assertEqual(hp_names("low"), ["high", "mid_a", "mid_b"])
+        
+        # A task outside the set is compared by priority value
+        outsider = Task(C=1.0, T=12.0, priority=5)
+        self.assertEqual(
+            [t.name for t in taskset.get_higher_priority_tasks(outsider)],
+            ["high", "mid_a", "mid_b"],
+        )
+    
+    def test_tasks_stored_as_tuple(self):
+        """Test that the task set stores its tasks as an immutable tuple."""
+        taskset = TaskSet(tasks=[Task(C=1.0, T=10.0), Task(C=1.0, T=5.0)])
+        self.assertIsInstance(taskset.tasks, tuple)
+        self.assertIsInstance(TaskSet().tasks, tuple)
+    
+    def test_tasks_keep_given_order(self):
+        """Test that tasks stay in the given order while sorted access uses priority."""
+        tasks = [
+            Task(C=1.0, T=20.0, name="τ1"),
+            Task(C=1.0, T=5.0, name="τ2"),
+            Task(C=1.0, T=10.0, name="τ3"),
+        ]
+        taskset = TaskSet(tasks=tasks)
+        self.assertEqual([t.name for t in taskset], ["τ1", "τ2", "τ3"])
+        self.assertEqual(taskset[1].T, 5.0)
+        self.assertEqual([t.name for t in taskset.get_sorted_tasks()], ["τ2", "τ3", "τ1"])
+    
+    def test_get_by_name(self):
+        """Test looking up tasks by name."""
+        taskset = TaskSet(tasks=[Task(C=1.0, T=10.0, name="τ1"), Task(C=1.0, T=5.0, name="τ2")])
+        self.assertEqual(taskset.get("τ1").T, 10.0)
+        self.assertEqual(taskset.get("τ2").priority, 0)
+        self.assertIsNone(taskset.get("missing"))
+    
+    def test_rate_monotonic_leaves_given_tasks_unchanged(self):
+        """Test that priority assignment does not modify the caller's tasks."""
+        task = Task(C=1.0, T=4.0)
+        lookup = {task: 1}
+        TaskSet(tasks=[task, Task(C=2.0, T=6.0)])
+        self.assertIsNone(task.priority)
+        self.assertEqual(task.name, "")
+        self.assertIn(task, lookup)
+        
+        # The same task can be reused in another set without priorities
+        taskset = TaskSet(tasks=[Task(C=1.0, T=3.0), task])
+        self.assertEqual(taskset[1].priority, 1)
+        self.assertEqual(str(taskset[1]), "Task(τ2: C=1.0, T=4.0, D=4.0, prio=1)")
+    
+    def test_as_arrays(self):
+        """Test that as_arrays returns parameters in priority order."""
+        tasks = [
+            Task(C=2.0, T=20.0, D=15.0, name="τ1"),
+            Task(C=1.0, T=5.0, name="τ2"),
+        ]
+        taskset = TaskSet(tasks=tasks)
+        C, T, D, priority, names = taskset.as_arrays()
+        
+        self.assertEqual(C.tolist(), [1.0, 2.0])
+        self.assertEqual(T.tolist(), [5.0, 20.0])
+        self.assertEqual(D.tolist(), [5.0, 15.0])
+        self.assertEqual(priority.tolist(), [0, 1])
+        self.assertEqual(names, ["τ2", "τ1"])
+    
+    def test_get_hp_arrays(self):
+        """Test that higher-priority arrays match the higher-priority tasks."""
+        tasks = [
+            Task(C=3.0, T=20.0, name="τ1"),
+            Task(C=1.0, T=5.0, name="τ2"),
+            Task(C=2.0, T=10.0, name="τ3"),
+        ]
+        taskset = TaskSet(tasks=tasks)
+        self.assertEqual(taskset.C_arr.tolist(), [1.0, 2.0, 3.0])
+        self.assertEqual(taskset.T_arr.tolist(), [5.0, 10.0, 20.0])
+        self.assertEqual(taskset.D_arr.tolist(), [5.0, 10.0, 20.0])
+        
+        for task in taskset:
+            C_hp, T_hp = taskset.get_hp_arrays(task)
+            hp_tasks = taskset.get_higher_priority_tasks(task)
+            self.assertEqual(C_hp.tolist(), [t.C for t in hp_tasks])
+            self.assertEqual(T_hp.tolist(), [t.T for t in hp_tasks])
+        
+        # The arrays are shared with the task set, so they cannot be written
+        with self.assertRaises(ValueError):
+            taskset.C_arr[0] = 5.0
+        with self.assertRaises(ValueError):
+            taskset.get_hp_arrays(taskset.get_sorted_tasks()[2])[1][0] = 1.0
+    
     def test_empty_taskset(self):
         """Test creating an empty task set."""
         taskset = TaskSet()
         self.assertEqual(len(taskset), 0)
         self.assertEqual(taskset.total_utilization, 0.0)
+    
+    def test_taskset_is_immutable(self):
+        """Test that tasks cannot be replaced once the set is built."""
+        taskset = TaskSet(tasks=[Task(C=1.0, T=5.0), Task(C=2.0, T=10.0)])
+        self.assertAlmostEqual(taskset.total_utilization, 0.4)
+        schedulable, response_times = analyze_taskset(taskset)
+        
+        with self.assertRaises(FrozenInstanceError):
+            taskset.tasks = (Task(C=9.0, T=10.0, priority=0),)
+        
+        # Cached results still describe the original tasks
+        self.assertEqual(len(taskset), 2)
+        self.assertAlmostEqual(taskset.total_utilization, 0.4)
+        self.assertEqual(analyze_taskset(taskset), (schedulable, response_times))
+        self.assertEqual(pickle.loads(pickle.dumps(taskset)), taskset)
 
 
 class TestRTA(unittest.TestCase):
@@ -269,6 +411,31 @@ class TestRTA(unittest.TestCase):
         self.assertIsNotNone(response_times["τ1"])  # First task should be schedulable
         self.assertIsNone(response_times["τ2"])  # Second task should fail
     
+    def test_taskset_short_circuit(self):
+        """Test that short_circuit stops at the first unschedulable task."""
+        tasks = [
+            Task(C=3.0, T=5.0, name="τ1"),
+            Task(C=3.0, T=5.0, name="τ2"),
+            Task(C=1.0, T=20.0, name="τ3"),
+        ]
+        taskset = TaskSet(tasks=tasks)
+        schedulable, response_times = analyze_taskset(taskset, short_circuit=True)
+        
+        self.assertFalse(schedulable)
+        self.assertEqual(list(response_times), ["τ1", "τ2"])
+        self.assertIsNone(response_times["τ2"])
+    
+    def test_taskset_identical_parameters_keep_names(self):
+        """Test that task sets with identical parameters report their own names."""
+        ts1 = TaskSet(tasks=[Task(C=1.0, T=4.0, name="a"), Task(C=2.0, T=6.0, name="b")])
+        ts2 = TaskSet(tasks=[Task(C=1.0, T=4.0, name="x"), Task(C=2.0, T=6.0, name="y")])
+        
+        _, rt1 = analyze_taskset(ts1)
+        _, rt2 = analyze_taskset(ts2)
+        
+        self.assertEqual(rt1, {"a": 1.0, "b": 3.0})
+        self.assertEqual(rt2, {"x": 1.0, "y": 3.0})
+    
     def test_taskset_single_task(self):
         """Test analyzing a task set with a single task."""
         tasks = [Task(C=5.0, T=10.0, name="τ1")]
@@ -307,6 +474,103 @@ class TestRTA(unittest.TestCase):
                 rt = response_times[task.name]
                 self.assertIsNotNone(rt)
                 self.assertLessEqual(rt, task.D)
+    
+    def test_taskset_fractional_parameters(self):
+        """Test that exactly scalable fractional parameters give the same results."""
+        tasks = [
+            Task(C=0.5, T=2.25, name="τ1"),
+            Task(C=1.5, T=3.0, name="τ2"),
+            Task(C=0.75, T=12.0, name="τ3"),
+        ]
+        taskset = TaskSet(tasks=tasks)
+        schedulable, response_times = analyze_taskset(taskset)
+        
+        self.assertTrue(schedulable)
+        # R3 = 0.75 + ceil(R3/2.25)*0.5 + ceil(R3/3)*1.5 converges to 5.25
+        self.assertAlmostEqual(response_times["τ3"], 5.25, places=9)
+        for task in taskset:
+            hp_tasks = taskset.get_higher_priority_tasks(task)
+            self.assertAlmostEqual(
+                response_times[task.name],
+                compute_response_time(task, hp_tasks),
+                places=9,
+            )
+    
+    def test_taskset_small_and_large_sizes_agree(self):
+        """Test that small and large task sets give per-task response times."""
+        for n in (2, 7, 40):
+            tasks = [Task(C=0.2 + 0.01 * i, T=10.0 + 3 * i) for i in range(n)]
+            taskset = TaskSet(tasks=tasks)
+            _, response_times = analyze_taskset(taskset)
+            
+            for task in taskset:
+                hp_tasks = taskset.get_higher_priority_tasks(task)
+                expected = compute_response_time(task, hp_tasks)
+                if expected is None:
+                    self.assertIsNone(response_times[task.name])
+                else:
+                    self.assertAlmostEqual(response_times[task.name], expected, places=9)
+    
+    def test_taskset_integer_kernel_large_set(self):
+        """Test integer and dyadic sets too large for a generated analyzer."""
+        for unit in (1, 0.25):
+            # 40 tasks is more than any generated analyzer handles
+            tasks = [Task(C=unit * (1 + i % 3), T=unit * (64 + 4 * i)) for i in range(40)]
+            taskset = TaskSet(tasks=tasks)
+            with mock.patch.object(
+                rta.analysis, "_rta_kernel_int", wraps=rta.analysis._rta_kernel_int
+            ) as kernel:
+                _, response_times = analyze_taskset(taskset)
+            self.assertEqual(kernel.call_count, 40)
+            
+            for task in taskset:
+                hp_tasks = taskset.get_higher_priority_tasks(task)
+                self.assertEqual(response_times[task.name], compute_response_time(task, hp_tasks))
+    
+    def test_taskset_tied_priorities(self):
+        """Test that tasks sharing a priority level do not preempt each other."""
+        tasks = [
+            Task(C=1, T=8, name="τ1", priority=0),
+            Task(C=2, T=12, name="τ2", priority=1),
+            Task(C=1, T=12, name="τ3", priority=1),
+            Task(C=3, T=24, name="τ4", priority=2),
+        ]
+        taskset = TaskSet(tasks=tasks)
+        with mock.patch.object(
+            rta.analysis, "_rta_kernel_int", wraps=rta.analysis._rta_kernel_int
+        ) as kernel:
+            schedulable, response_times = analyze_taskset(taskset)
+        self.assertEqual(kernel.call_count, 4)
+        
+        self.assertTrue(schedulable)
+        # τ2 and τ3 are only interfered with by τ1; τ4 by all three
+        self.assertEqual(response_times, {"τ1": 1.0, "τ2": 3.0, "τ3": 2.0, "τ4": 7.0})
+        for task in taskset:
+            hp_tasks = taskset.get_higher_priority_tasks(task)
+            self.assertEqual(response_times[task.name], compute_response_time(task, hp_tasks))
+    
+    def test_hyperbolic_bound_accepts(self):
+        """Test that a low-utilization implicit-deadline set passes the bound."""
+        # (1 + 0.2) * (1 + 0.25) * (1 + 0.1) = 1.65 <= 2
+        tasks = [
+            Task(C=1.0, T=5.0, name="τ1"),
+            Task(C=2.0, T=8.0, name="τ2"),
+            Task(C=2.0, T=20.0, name="τ3"),
+        ]
+        taskset = TaskSet(tasks=tasks)
+        self.assertTrue(satisfies_hyperbolic_bound(taskset))
+        self.assertTrue(analyze_taskset(taskset)[0])
+    
+    def test_hyperbolic_bound_inconclusive(self):
+        """Test that the bound is not applied above 2 or with constrained deadlines."""
+        # (1 + 0.5) * (1 + 0.5) = 2.25 > 2, yet harmonic periods are schedulable
+        taskset = TaskSet(tasks=[Task(C=2.0, T=4.0), Task(C=4.0, T=8.0)])
+        self.assertFalse(satisfies_hyperbolic_bound(taskset))
+        self.assertTrue(analyze_taskset(taskset)[0])
+        
+        # D < T is outside the bound's model
+        taskset = TaskSet(tasks=[Task(C=1.0, T=10.0, D=2.0), Task(C=1.0, T=20.0)])
+        self.assertFalse(satisfies_hyperbolic_bound(taskset))
 
 
 if __name__ == "__main__":
@@ -1,8 +1,10 @@
 """UUniFast-based random tests for RTA robustness."""
 
+import random
 import unittest
+
 from rta.generators import uunifast, generate_taskset
-from rta.analysis import analyze_taskset
+from rta.analysis import analyze_taskset, satisfies_hyperbolic_bound
 
 
 class TestUUniFast(unittest.TestCase):
@@ -31,6 +33,27 @@ class TestUUniFast(unittest.TestCase):
         for a, b in zip(u1, u2):
             self.assertAlmostEqual(a, b, places=10)
     
+    def test_uunifast_matches_sequential(self):
+        """Test that UUniFast matches the sequential algorithm on the same draws."""
+        n, target_u, seed = 8, 0.9, 321
+        rng = random.Random(seed)
+        draws = [rng.random() for _ in range(n - 1)]
+        
+        expected = []
+        sum_u = target_u
+        for i in range(1, n):
+            next_sum_u = sum_u * (draws[i - 1] ** (1.0 / (n - i)))
+            expected.append(sum_u - next_sum_u)
+            sum_u = next_sum_u
+        expected.append(sum_u)
+        
+        for a, b in zip(uunifast(n, target_u, seed=seed), expected):
+            self.assertAlmostEqual(a, b, places=12)
+    
+    def test_uunifast_single_task(self):
+        """Test that a single task receives the whole utilization."""
+        self.assertEqual(uunifast(1, 0.8, seed=7), [0.8])
+    
     def test_uunifast_invalid_n(self):
         """Test that invalid n raises ValueError."""
         with self.assertRaises(ValueError):
@@ -82,12 +105,27 @@ class TestTaskSetGenerator(unittest.TestCase):
     def test_generate_taskset_reproducibility(self):
         """Test that same seed produces same task set."""
         ts1 = generate_taskset(5, 0.6, seed=111)
+        # Seeded sets are cached; clear it so the second set is regenerated
+        generate_taskset.cache_clear()
         ts2 = generate_taskset(5, 0.6, seed=111)
         
+        self.assertIsNot(ts1, ts2)
         for t1, t2 in zip(ts1, ts2):
             self.assertAlmostEqual(t1.C, t2.C, places=10)
             self.assertAlmostEqual(t1.T, t2.T, places=10)
             self.assertAlmostEqual(t1.D, t2.D, places=10)
+    
+    def test_generate_taskset_cached_by_seed(self):
+        """Test that seeded task sets are shared and unseeded ones are fresh."""
+        self.assertIs(generate_taskset(5, 0.6, seed=222), generate_taskset(5, 0.6, seed=222))
+        self.assertIsNot(generate_taskset(5, 0.6, seed=222), generate_taskset(5, 0.7, seed=222))
+        self.assertIsNot(generate_taskset(5, 0.6), generate_taskset(5, 0.6))
+        
+        # Shared sets cannot be changed, either directly or through their tasks
+        with self.assertRaises(AttributeError):
+            generate_taskset(5, 0.6, seed=222)[0].C = 1.0
+        with self.assertRaises(AttributeError):
+            generate_taskset(5, 0.6, seed=222).tasks = ()
 
 
 class TestRandomSchedulability(unittest.TestCase):
@@ -142,6 +180,14 @@ class TestRandomSchedulability(unittest.TestCase):
             task = taskset.tasks[0]
             self.assertAlmostEqual(response_times[task.name], task.C, places=6)
     
+    def test_hyperbolic_bound_is_sufficient(self):
+        """Test that every task set accepted by the hyperbolic bound passes RTA."""
+        for i in range(30):
+            taskset = generate_taskset(5, 0.7, seed=6000+i)
+            if satisfies_hyperbolic_bound(taskset):
+                schedulable, _ = analyze_taskset(taskset)
+                self.assertTrue(schedulable)
+    
     def test_response_times_bounded(self):
         """Test that response times are bounded by deadlines for schedulable tasks."""
         for i in range(10):
@@ -179,6 +225,7 @@ class TestSchedulabilityExperiment(unittest.TestCase):
             min_period=10.0,
             max_period=100.0,
             seed=12345,
+            max_workers=1,
         )
         
         # Verify results structure
@@ -193,6 +240,25 @@ class TestSchedulabilityExperiment(unittest.TestCase):
         # Verify general trend: higher U should have lower or equal schedulability
         # Note: with only 10 samples there can be noise, so we use a weak check
         self.assertGreaterEqual(results[0.3], results[0.7] - 0.3)
+    
+    def test_plot_svg_backend(self):
+        """Test that the default SVG backend writes a well-formed SVG file."""
+        import os
+        import tempfile
+        import xml.etree.ElementTree as ET
+        
+        try:
+            from experiments.sched_util_plot import plot_schedulability_vs_utilisation
+        except ImportError:
+            self.skipTest("experiments.sched_util_plot not available")
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            output_path = os.path.join(tmp, "plot.svg")
+            plot_schedulability_vs_utilisation({0.3: 1.0, 0.6: 0.9, 0.9: 0.4}, output_path)
+            root = ET.parse(output_path).getroot()
+        
+        self.assertTrue(root.tag.endswith("svg"))
+        self.assertEqual(len(root.findall("{http://www.w3.org/2000/svg}circle")), 3)
 
 
 if __name__ == "__main__":